@@ -1,40 +1,156 @@
+import asyncio
+import concurrent.futures
+import functools
 import json
 import pathlib
 import os
+from collections import OrderedDict
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 from googletrans import Translator  # <-- ADDED
 
+try:
+    import orjson  # much faster config encode/decode
+except ImportError:
+    orjson = None
+
 # ================== CONFIG ==================
 
 TOKEN = os.getenv("TOKEN")  # Make sure TOKEN is set in your environment
 
-# Path to config file (must exist in same folder or will be created)
-CONFIG_PATH = pathlib.Path("config.json")
+# Config folder (created if missing): one file per guild, so a change only rewrites that guild
+#   config/guilds/<guild_id>.json  -> {"tracked_user_ids": [...], "panel": {...}}
+#   config/global.json             -> everything else (user_languages, auto_channel_langs)
+CONFIG_DIR = pathlib.Path("config")
+GUILDS_DIR = CONFIG_DIR / "guilds"
+GLOBAL_CONFIG_PATH = CONFIG_DIR / "global.json"
+
+# Old single-file config, migrated into CONFIG_DIR the first time the bot starts without it
+LEGACY_CONFIG_PATH = pathlib.Path("config.json")
+
+
+def guild_config_path(gid: int | str) -> pathlib.Path:
+    """Path of one guild's config file."""
+    return GUILDS_DIR / f"{gid}.json"
+
+
+def global_config_part(cfg: dict) -> dict:
+    """Everything in cfg that lives in global.json (i.e. not per-guild)."""
+    return {key: value for key, value in cfg.items() if key != "guilds"}
+
+
+def read_json(path: pathlib.Path):
+    """Read one JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_json(obj) -> str:
+    """Encode obj as indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def write_text_atomic(path: pathlib.Path, text: str):
+    """Atomically replace path (write a temp file, then swap it in)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def save_config(gid: int | str, guild_cfg: dict):
+    """Save config/guilds/<gid>.json."""
+    write_text_atomic(guild_config_path(gid), dump_json(guild_cfg))
+
+
+def save_global_config(cfg: dict):
+    """Save config/global.json."""
+    write_text_atomic(GLOBAL_CONFIG_PATH, dump_json(global_config_part(cfg)))
 
 
 def load_config():
-    """Load config.json or create default structure."""
-    if not CONFIG_PATH.exists():
-        return {"guilds": {}}
-    try:
-        with CONFIG_PATH.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print("Error reading config.json, using empty config:", e)
-        return {"guilds": {}}
+    """Load config/ (or migrate config.json) or create default structure."""
+    cfg = {}
+    migrate = False
+
+    if CONFIG_DIR.exists():
+        if GLOBAL_CONFIG_PATH.exists():
+            try:
+                cfg = read_json(GLOBAL_CONFIG_PATH)
+            except Exception as e:
+                print("Error reading global.json, using empty settings:", e)
+
+        cfg["guilds"] = {}
+        for path in GUILDS_DIR.glob("*.json"):
+            try:
+                cfg["guilds"][path.stem] = read_json(path)
+            except Exception as e:
+                print(f"Error reading {path}, skipping guild:", e)
+
+    elif LEGACY_CONFIG_PATH.exists():
+        try:
+            cfg = read_json(LEGACY_CONFIG_PATH)
+            migrate = True
+        except Exception as e:
+            print("Error reading config.json, using empty config:", e)
+
+    cfg.setdefault("guilds", {})
+    cfg.setdefault("user_languages", {})       # {"user_id": "en", ...}
+    cfg.setdefault("auto_channel_langs", {})   # {"channel_id": ["en", "it"], ...}
 
+    if migrate:
+        for gid, guild_cfg in cfg["guilds"].items():
+            save_config(gid, guild_cfg)
+        save_global_config(cfg)
+        print(f"Migrated {LEGACY_CONFIG_PATH} into {CONFIG_DIR}/")
 
-def save_config(cfg):
-    """Save config.json."""
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    return cfg
 
 
 config = load_config()
 
+# Filled by mark_config_dirty(); the flush_config loop writes at most once per tick
+_dirty_guilds: set[str] = set()
+_global_dirty = False
+
+
+def mark_config_dirty(guild_id: int | str | None = None):
+    """Schedule one guild's file (or global.json, if no guild given) for the next flush_config tick."""
+    global _global_dirty
+    if guild_id is None:
+        _global_dirty = True
+    else:
+        _dirty_guilds.add(str(guild_id))
+
+
+def take_dirty_config() -> list[tuple[pathlib.Path, str]]:
+    """Encode every file marked dirty as (path, text) and clear the marks."""
+    global _global_dirty
+    writes = [
+        (guild_config_path(gid), dump_json(config["guilds"][gid]))
+        for gid in _dirty_guilds
+        if gid in config["guilds"]
+    ]
+    _dirty_guilds.clear()
+
+    if _global_dirty:
+        writes.append((GLOBAL_CONFIG_PATH, dump_json(global_config_part(config))))
+        _global_dirty = False
+    return writes
+
+
+def write_config_files(writes: list[tuple[pathlib.Path, str]]):
+    """Write the output of take_dirty_config()."""
+    for path, text in writes:
+        write_text_atomic(path, text)
+
 # ================== DISCORD SETUP ==================
 
 intents = discord.Intents.default()
@@ -43,17 +159,111 @@ intents.members = True      # needed for guild.get_member()
 intents.presences = True    # needed for status (online / idle / dnd / offline)
 intents.message_content = True  # <-- NEEDED for translation commands/on_message
 
-bot = commands.Bot(command_prefix="!", intents=intents)  # prefix used for translator cmds
+
+class StatusBot(commands.Bot):
+    async def close(self):
+        """Disconnect, then release the translator's worker threads and HTTP connections."""
+        await super().close()
+        _translate_pool.shutdown(wait=False, cancel_futures=True)
+        client = getattr(translator, "client", None)
+        if client is not None:
+            client.close()
+
+
+bot = StatusBot(command_prefix="!", intents=intents)  # prefix used for translator cmds
 
 # ============ TRANSLATION BOT SETUP ============
 
+# One Translator for the whole bot: it wraps a single keep-alive httpx.Client (HTTP/2),
+# so every translate/detect call from the worker pool reuses the same connections
 translator = Translator()
 
-# Store user language preferences in memory: {user_id: "en", ...}
-user_languages: dict[int, str] = {}
+# googletrans is synchronous; calls run on a small dedicated pool (so a message flood
+# can't open unbounded connections) and are dropped after this many seconds
+TRANSLATE_TIMEOUT = 8
+_translate_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="translate",
+)
+
+
+async def translate_async(text: str, **kwargs):
+    """Run translator.translate off the event loop so the gateway keeps ticking."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(_translate_pool, functools.partial(translator.translate, text, **kwargs)),
+        timeout=TRANSLATE_TIMEOUT,
+    )
+
+
+async def detect_async(text: str):
+    """Run translator.detect off the event loop so the gateway keeps ticking."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(_translate_pool, translator.detect, text),
+        timeout=TRANSLATE_TIMEOUT,
+    )
+
+
+# LRU caches shared by !translate and auto-translate, so repeated text skips the API
+TRANSLATION_CACHE_SIZE = 4096
+
+# {(src, dest, text): (detected_src, translated_text)}
+_translation_cache: OrderedDict[tuple[str, str, str], tuple[str, str]] = OrderedDict()
+
+# {text: detected_lang}
+_detect_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key):
+    """Return a cached value (or None), marking it as most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
 
-# Store per-channel auto-translate settings: {channel_id: ["en", "it", "ar"]}
-auto_channel_langs: dict[int, list[str]] = {}
+
+def _cache_put(cache: OrderedDict, key, value):
+    """Store a value, evicting the least recently used entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > TRANSLATION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+async def cached_translate(text: str, dest: str, src: str = "auto") -> tuple[str, str]:
+    """Translate text, returning (source_lang, translated_text)."""
+    key = (src, dest, text)
+    hit = _cache_get(_translation_cache, key)
+    if hit is not None:
+        return hit
+
+    result = await translate_async(text, src=src, dest=dest)
+    value = (result.src, result.text)
+    _cache_put(_translation_cache, key, value)
+    return value
+
+
+async def cached_detect(text: str) -> str:
+    """Detect the language code of text."""
+    hit = _cache_get(_detect_cache, text)
+    if hit is not None:
+        return hit
+
+    detection = await detect_async(text)
+    _cache_put(_detect_cache, text, detection.lang)
+    return detection.lang
+
+
+# User language preferences, loaded from config/global.json: {user_id: "en", ...}
+user_languages: dict[int, str] = {
+    int(uid): code for uid, code in config["user_languages"].items()
+}
+
+# Per-channel auto-translate settings, loaded from config/global.json: {channel_id: ["en", "it", "ar"]}
+auto_channel_langs: dict[int, list[str]] = {
+    int(cid): list(langs) for cid, langs in config["auto_channel_langs"].items()
+}
 
 SUPPORTED_LANGS = {
     "en": "English",
@@ -70,6 +280,20 @@ SUPPORTED_LANGS = {
     "ar": "Arabic",
 }
 
+SUPPORTED_LANG_CODES: frozenset[str] = frozenset(SUPPORTED_LANGS)
+
+# Preformatted labels: "en (English)" for command replies, "**English (`en`)**" for auto-translations
+PRETTY_LANG = {c: f"{c} ({n})" for c, n in SUPPORTED_LANGS.items()}
+REPLY_LANG_LABEL = {c: f"**{n} (`{c}`)**" for c, n in SUPPORTED_LANGS.items()}
+
+# Prebuilt strings for the language help / error messages (SUPPORTED_LANGS never changes)
+SUPPORTED_LIST_STR = ", ".join(PRETTY_LANG.values())
+SUPPORTED_KEYS_STR = ", ".join(SUPPORTED_LANGS.keys())
+LANGS_MESSAGE = (
+    "🌐 Example language codes you can use with `!setlang` or channel settings:\n"
+    + "\n".join(f"`{code}` → {name}" for code, name in SUPPORTED_LANGS.items())
+)
+
 # ================== CONFIG HELPERS ==================
 
 def get_guild_config(guild_id: int) -> dict:
@@ -89,24 +313,36 @@ def get_guild_config(guild_id: int) -> dict:
             "tracked_user_ids": [],
             # "panel": {...} added later
         }
-        save_config(config)
+        mark_config_dirty(gid)
     return config["guilds"][gid]
 
 
-def status_to_emoji_text(status: discord.Status | None) -> tuple[str, str]:
-    """Convert discord.Status into (emoji, human text)."""
-    if status is None:
-        return "⚫", "Offline"
+# In-memory sets mirroring each guild's "tracked_user_ids" (JSON has no set type): {guild_id: {user_id, ...}}
+_tracked_sets: dict[int, set[int]] = {}
+
 
-    if status is discord.Status.online:
-        return "🟢", "Online"
-    if status is discord.Status.idle:
-        return "🌙", "Idle"
-    if status is discord.Status.dnd:
-        return "⛔", "Do Not Disturb"
+def get_tracked_set(guild_id: int, guild_cfg: dict) -> set[int]:
+    """Return the set of tracked user IDs for one guild, built once from its list."""
+    tracked_set = _tracked_sets.get(guild_id)
+    if tracked_set is None:
+        tracked_set = set(guild_cfg.get("tracked_user_ids", []))
+        _tracked_sets[guild_id] = tracked_set
+    return tracked_set
 
-    # includes offline / invisible
-    return "⚫", "Offline"
+
+_STATUS_MAP: dict[discord.Status, tuple[str, str]] = {
+    discord.Status.online: ("🟢", "Online"),
+    discord.Status.idle: ("🌙", "Idle"),
+    discord.Status.dnd: ("⛔", "Do Not Disturb"),
+    discord.Status.offline: ("⚫", "Offline"),
+    discord.Status.invisible: ("⚫", "Offline"),
+}
+
+
+def status_to_emoji_text(status: discord.Status | None) -> tuple[str, str]:
+    """Convert discord.Status into (emoji, human text)."""
+    # None / unknown statuses show as offline
+    return _STATUS_MAP.get(status, ("⚫", "Offline"))
 
 
 def build_status_embed(guild: discord.Guild, guild_cfg: dict) -> discord.Embed:
@@ -162,6 +398,10 @@ async def on_ready():
     if not update_panels.is_running():
         update_panels.start()
 
+    # Start background config writer
+    if not flush_config.is_running():
+        flush_config.start()
+
 
 # ================== TRANSLATOR PREFIX COMMANDS ==================
 
@@ -175,15 +415,16 @@ async def set_language(ctx: commands.Context, lang_code: str):
     """
     lang_code = lang_code.lower()
 
-    if lang_code not in SUPPORTED_LANGS:
-        supported = ", ".join(f"{k} ({v})" for k, v in SUPPORTED_LANGS.items())
+    if lang_code not in SUPPORTED_LANG_CODES:
         await ctx.send(
             f"❌ Unknown language code `{lang_code}`.\n"
-            f"Supported examples: {supported}"
+            f"Supported examples: {SUPPORTED_LIST_STR}"
         )
         return
 
     user_languages[ctx.author.id] = lang_code
+    config["user_languages"][str(ctx.author.id)] = lang_code
+    mark_config_dirty()
     await ctx.send(
         f"✅ Your target language has been set to **{SUPPORTED_LANGS[lang_code]}** (`{lang_code}`)."
     )
@@ -220,9 +461,7 @@ async def translate_text(ctx: commands.Context, *, text: str = None):
         return
 
     try:
-        result = translator.translate(text, dest=target_lang)
-        source_lang = result.src
-        translated = result.text
+        source_lang, translated = await cached_translate(text, dest=target_lang)
 
         await ctx.send(
             f"**Original ({source_lang})**: {text}\n"
@@ -238,9 +477,7 @@ async def list_langs(ctx: commands.Context):
     """
     Show some example language codes.
     """
-    lines = [f"`{code}` → {name}" for code, name in SUPPORTED_LANGS.items()]
-    message = "🌐 Example language codes you can use with `!setlang` or channel settings:\n" + "\n".join(lines)
-    await ctx.send(message)
+    await ctx.send(LANGS_MESSAGE)
 
 
 # ================== CHANNEL AUTO-TRANSLATE (PREFIX COMMANDS) ==================
@@ -267,18 +504,19 @@ async def set_channel_langs(
     lang_codes = [code.lower() for code in lang_codes]
 
     # Validate language codes
-    invalid = [code for code in lang_codes if code not in SUPPORTED_LANGS]
+    invalid = [code for code in lang_codes if code not in SUPPORTED_LANG_CODES]
     if invalid:
         invalid_str = ", ".join(invalid)
-        supported = ", ".join(SUPPORTED_LANGS.keys())
         await ctx.send(
             f"❌ Invalid language code(s): {invalid_str}\n"
-            f"Supported examples: {supported}"
+            f"Supported examples: {SUPPORTED_KEYS_STR}"
         )
         return
 
     auto_channel_langs[channel.id] = list(lang_codes)
-    pretty = ", ".join(f"{code} ({SUPPORTED_LANGS[code]})" for code in lang_codes)
+    config["auto_channel_langs"][str(channel.id)] = list(lang_codes)
+    mark_config_dirty()
+    pretty = ", ".join(PRETTY_LANG[code] for code in lang_codes)
     await ctx.send(
         f"✅ Auto-translate enabled in {channel.mention} for languages: {pretty}"
     )
@@ -297,7 +535,7 @@ async def channel_langs(ctx: commands.Context):
         await ctx.send(f"🛈 No auto-translate languages set for {channel.mention}.")
         return
 
-    pretty = ", ".join(f"{code} ({SUPPORTED_LANGS.get(code, code)})" for code in langs)
+    pretty = ", ".join(PRETTY_LANG.get(code) or f"{code} ({code})" for code in langs)
     await ctx.send(f"🌍 {channel.mention} auto-translates to: {pretty}")
 
 
@@ -312,6 +550,8 @@ async def clear_channel_langs(ctx: commands.Context):
 
     if channel.id in auto_channel_langs:
         del auto_channel_langs[channel.id]
+        config["auto_channel_langs"].pop(str(channel.id), None)
+        mark_config_dirty()
         await ctx.send(f"✅ Auto-translate disabled for {channel.mention}.")
     else:
         await ctx.send(f"🛈 No auto-translate settings found for {channel.mention}.")
@@ -343,17 +583,19 @@ async def adduser(interaction: discord.Interaction, user: discord.User):
 
     guild_cfg = get_guild_config(interaction.guild.id)
     tracked = guild_cfg.get("tracked_user_ids", [])
+    tracked_set = get_tracked_set(interaction.guild.id, guild_cfg)
 
-    if user.id in tracked:
+    if user.id in tracked_set:
         await interaction.response.send_message(
             f"ℹ️ {user.mention} is already in the tracking list.",
             ephemeral=True,
         )
         return
 
+    tracked_set.add(user.id)
     tracked.append(user.id)
     guild_cfg["tracked_user_ids"] = tracked
-    save_config(config)
+    mark_config_dirty(interaction.guild.id)
 
     await interaction.response.send_message(
         f"✅ Added {user.mention} to the Zexr Status tracking list.",
@@ -385,17 +627,19 @@ async def removeuser(interaction: discord.Interaction, user: discord.User):
 
     guild_cfg = get_guild_config(interaction.guild.id)
     tracked = guild_cfg.get("tracked_user_ids", [])
+    tracked_set = get_tracked_set(interaction.guild.id, guild_cfg)
 
-    if user.id not in tracked:
+    if user.id not in tracked_set:
         await interaction.response.send_message(
             f"ℹ️ {user.mention} is not currently being tracked.",
             ephemeral=True,
         )
         return
 
+    tracked_set.discard(user.id)
     tracked.remove(user.id)
     guild_cfg["tracked_user_ids"] = tracked
-    save_config(config)
+    mark_config_dirty(interaction.guild.id)
 
     await interaction.response.send_message(
         f"🗑️ Removed {user.mention} from the tracking list.",
@@ -445,12 +689,17 @@ async def statuspanel(
     embed = build_status_embed(interaction.guild, guild_cfg)
     message = await channel.send(embed=embed)
 
+    # Forget the old panel's hash; the new one already shows this embed
+    old_panel = guild_cfg.get("panel") or {}
+    _last_panel_hash.pop(old_panel.get("message_id"), None)
+    _last_panel_hash[message.id] = hash(embed.description)
+
     # Store where the panel is so the loop can edit it
     guild_cfg["panel"] = {
         "channel_id": channel.id,
         "message_id": message.id,
     }
-    save_config(config)
+    mark_config_dirty(interaction.guild.id)
 
     await interaction.followup.send(
         f"✅ Status panel created in {channel.mention}.\n"
@@ -461,45 +710,97 @@ async def statuspanel(
 
 # ================== BACKGROUND TASK (STATUS PANELS) ==================
 
-@tasks.loop(seconds=60)
-async def update_panels():
-    """Update all configured panels every 60 seconds."""
-    for gid_str, guild_cfg in config.get("guilds", {}).items():
-        panel_info = guild_cfg.get("panel")
-        if not panel_info:
-            continue
-
-        guild_id = int(gid_str)
-        guild = bot.get_guild(guild_id)
-        if guild is None:
-            continue
-
-        channel_id = panel_info.get("channel_id")
-        message_id = panel_info.get("message_id")
-        if not channel_id or not message_id:
-            continue
-
-        channel = guild.get_channel(channel_id)
-        if channel is None:
-            continue
+# Max panels being edited at the same time
+_panel_semaphore = asyncio.Semaphore(16)
+
+# Hash of the description last sent to each panel: {message_id: hash}
+_last_panel_hash: dict[int, int] = {}
+
+# Presence of every tracked member at the last panel update: {guild_id: ((user_id, status), ...)}
+_last_status: dict[int, tuple] = {}
+
+
+async def _update_one(gid_str: str, guild_cfg: dict) -> None:
+    """Refresh the panel message for one guild."""
+    panel_info = guild_cfg["panel"]
 
+    guild_id = int(gid_str)
+    guild = bot.get_guild(guild_id)
+    if guild is None:
+        return
+
+    channel_id = panel_info.get("channel_id")
+    message_id = panel_info.get("message_id")
+    if not channel_id or not message_id:
+        return
+
+    channel = guild.get_channel(channel_id)
+    if channel is None:
+        return
+
+    # Nobody's presence moved – skip building the embed at all
+    snap = tuple(
+        (uid, getattr(guild.get_member(uid), "status", None))
+        for uid in guild_cfg.get("tracked_user_ids", [])
+    )
+    if _last_status.get(guild_id) == snap:
+        return
+
+    embed = build_status_embed(guild, guild_cfg)
+    panel_hash = hash(embed.description)
+    # Nothing visible changed since the last edit – save the rate-limit budget
+    if _last_panel_hash.get(message_id) == panel_hash:
+        _last_status[guild_id] = snap
+        return
+
+    async with _panel_semaphore:
         try:
-            message = await channel.fetch_message(message_id)
-        except Exception:
+            # A partial message can be edited without fetching it first
+            await channel.get_partial_message(message_id).edit(embed=embed)
+            _last_panel_hash[message_id] = panel_hash
+        except discord.NotFound:
             # Panel message missing (deleted?) – try to recreate once
             try:
-                embed = build_status_embed(guild, guild_cfg)
                 new_msg = await channel.send(embed=embed)
                 guild_cfg["panel"]["message_id"] = new_msg.id
-                save_config(config)
+                mark_config_dirty(gid_str)
+                _last_panel_hash.pop(message_id, None)
+                _last_panel_hash[new_msg.id] = panel_hash
             except Exception:
-                continue
-        else:
-            try:
-                embed = build_status_embed(guild, guild_cfg)
-                await message.edit(embed=embed)
-            except Exception:
-                continue
+                return
+        except Exception:
+            return
+
+    _last_status[guild_id] = snap
+
+
+# Max panels refreshed per tick; with more, the ticks take turns round-robin
+PANEL_BUDGET = 25
+
+# Where the next tick starts in the list of configured panels
+_panel_cursor = 0
+
+
+@tasks.loop(seconds=60)
+async def update_panels():
+    """Update up to PANEL_BUDGET configured panels every 60 seconds."""
+    global _panel_cursor
+    panels = [
+        (gid_str, guild_cfg)
+        for gid_str, guild_cfg in config.get("guilds", {}).items()
+        if guild_cfg.get("panel")
+    ]
+    if not panels:
+        return
+
+    start = _panel_cursor % len(panels)
+    batch = (panels[start:] + panels[:start])[:PANEL_BUDGET]
+    _panel_cursor = (start + len(batch)) % len(panels)
+
+    await asyncio.gather(
+        *(_update_one(gid_str, guild_cfg) for gid_str, guild_cfg in batch),
+        return_exceptions=True,
+    )
 
 
 @update_panels.before_loop
@@ -508,6 +809,31 @@ async def before_update_panels():
     await bot.wait_until_ready()
 
 
+# ================== BACKGROUND TASK (CONFIG FLUSH) ==================
+
+@tasks.loop(seconds=5)
+async def flush_config():
+    """Write the config files that changed since the last tick."""
+    # Encode on the loop so the worker thread never sees config mid-mutation
+    writes = take_dirty_config()
+    if not writes:
+        return
+
+    try:
+        await asyncio.to_thread(write_config_files, writes)
+    except Exception as e:
+        print("Error writing config:", e)
+        # Try again next tick
+        for path, _ in writes:
+            mark_config_dirty(None if path == GLOBAL_CONFIG_PATH else path.stem)
+
+
+@flush_config.after_loop
+async def after_flush_config():
+    """Write any pending changes when the loop stops (e.g. on shutdown)."""
+    write_config_files(take_dirty_config())
+
+
 # ================== AUTO-TRANSLATE ON_MESSAGE ==================
 
 @bot.event
@@ -521,42 +847,47 @@ async def on_message(message: discord.Message):
 
     channel = message.channel
 
-    # If the channel is configured for auto-translate, translate every message
-    if channel.id in auto_channel_langs:
-        target_langs = auto_channel_langs[channel.id]
-        text = message.content
+    # Only channels configured for auto-translate go any further
+    target_langs = auto_channel_langs.get(channel.id)
+    if not target_langs:
+        return
 
-        # Don't try to translate empty messages or only attachments
-        if not text.strip():
-            return
+    text = message.content
 
-        try:
-            # Detect original language once
-            detection = translator.detect(text)
-            src_lang = detection.lang
-
-            translations = []
-            for lang in target_langs:
-                # Skip if same language as source
-                if lang == src_lang:
-                    continue
-
-                result = translator.translate(text, src=src_lang, dest=lang)
-                translations.append(
-                    f"**{SUPPORTED_LANGS.get(lang, lang)} (`{lang}`)**: {result.text}"
-                )
-
-            if translations:
-                # Reply in the same channel, referencing the original message
-                response = (
-                    f"💬 Auto-translation of message from "
-                    f"**{SUPPORTED_LANGS.get(src_lang, src_lang)} (`{src_lang}`)**:\n"
-                    + "\n".join(translations)
-                )
-                await channel.send(response, reference=message)
+    # Don't try to translate empty messages or only attachments (isspace() doesn't copy the text)
+    if not text or text.isspace():
+        return
 
-        except Exception as e:
-            print(f"Error in auto-translate: {e}")
+    try:
+        # Detect original language once
+        src_lang = await cached_detect(text)
+
+        # Skip if same language as source (or not a code we support)
+        targets = [
+            lang for lang in target_langs
+            if lang != src_lang and lang in SUPPORTED_LANG_CODES
+        ]
+
+        # One request per target, all in flight at once
+        results = await asyncio.gather(
+            *(cached_translate(text, dest=lang, src=src_lang) for lang in targets)
+        )
+        translations = [
+            f"{REPLY_LANG_LABEL[lang]}: {translated}"
+            for lang, (_, translated) in zip(targets, results)
+        ]
+
+        if translations:
+            # Reply in the same channel, referencing the original message
+            src_label = REPLY_LANG_LABEL.get(src_lang) or f"**{src_lang} (`{src_lang}`)**"
+            response = (
+                f"💬 Auto-translation of message from {src_label}:\n"
+                + "\n".join(translations)
+            )
+            await channel.send(response, reference=message)
+
+    except Exception as e:
+        print(f"Error in auto-translate: {e}")
 
 
 # ================== RUN BOT ==================